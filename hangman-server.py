@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Project:    Proverbial Hangman
+File:       hangman-server.py
+Author:     agent
+
+Created:    2026-10-19
+
+Synopsis:
+            hangman-server.py [PORT]
+
+Description:
+            A multiplayer hangman server. Players connect with a
+            line based client, for example telnet or netcat, choose
+            a language and join a room. Everyone in a room guesses
+            the same proverb together, every guess is checked once
+            and the updated game is sent to every member of the room.
+
+            Optional arguments
+
+            PORT
+                port to listen on, 8023 by default
+
+            -h, --help
+                show this docstring and exit
+
+Notes:
+            See the docstring of hangman.py for notes.
+
+            A room's proverb comes from the proverbs file of the
+            language of the player who opened the room, the other
+            players see the game in their own language.
+
+            The game screen is rendered and encoded once per room
+            and language for every update, and the same bytes are
+            written to every member. Writes never wait for a client,
+            a client that doesn't read its data is disconnected once
+            its output buffer grows over MAX_BUFFER bytes.
+
+Exit codes:
+            0: Program exited without errors
+            1: one or modules couldn't be loaded
+            2: incorrect argument passed in command line
+"""
+
+import asyncio
+
+from hangman import *
+from lib.get_ui_strings import *
+
+__author__ = "agent"
+__copyright__ = "Copyright (c) 2026., agent"
+__license__ = "Apache 2.0"
+__version__ = "1.0"
+__email__ = "agent@local"
+__status__ = "Development"
+
+# Default port to listen on
+PORT = 8023
+# Clients with more unsent data than this are disconnected
+MAX_BUFFER = 64 * 1024
+
+# Set a string to clear the command line
+cls = "\033[H\033[J"
+
+
+class Room:
+    """
+    A game shared by the players in it.
+    Members are grouped by language, so an update is rendered
+    once for every language present in the room.
+    """
+    def __init__(self, name, strings):
+        self.name = name
+        # path of proverbs file of the language the room was opened in
+        prv_path = os.path.join("resources", strings[1])
+        # Uppercase proverb
+        self.proverb = get_proverb(prv_path).upper()
+        # Valid characters
+        self.alphabet = get_alphabet(prv_path)
+        # List of the letters guessed and not in the proverb
+        self.non_matches = []
+        # List of the letters guessed and in the proverb
+        self.matches = []
+        # The proverb with underscores replacing unknown letters
+        self.incomplete = incomplete_proverb(
+            self.proverb, self.matches, self.alphabet)
+        # language -> (strings of the language, set of writers)
+        self.members = {}
+
+    def join(self, language, strings, writer):
+        """
+        Adds a player to the room and sends them the current state.
+
+        :param language: the player's language
+        :type language: str
+        :param strings: the strings of the player's language
+        :type strings: list
+        :param writer: the player's stream writer
+        :type writer: asyncio.StreamWriter
+        """
+        if language not in self.members:
+            self.members[language] = (strings, set())
+        self.members[language][1].add(writer)
+        data = self.render(strings, "").encode()
+        self.send(language, writer, data)
+
+    def leave(self, language, writer):
+        """
+        Removes a player from the room.
+
+        :param language: the player's language
+        :type language: str
+        :param writer: the player's stream writer
+        :type writer: asyncio.StreamWriter
+        """
+        if language in self.members:
+            self.members[language][1].discard(writer)
+            if not self.members[language][1]:
+                del self.members[language]
+
+    def is_empty(self):
+        """
+        Checks if there are players left in the room.
+
+        :return: True | False
+        :rtype: bool
+        """
+        return not self.members
+
+    def is_over(self):
+        """
+        Checks if the game in the room was won or lost.
+
+        :return: True | False
+        :rtype: bool
+        """
+        if complete_proverb(self.incomplete):
+            return True
+        if len(self.non_matches) >= get_max_guess_number():
+            return True
+        return False
+
+    def guess(self, g):
+        """
+        Checks a guess made by a player of the room and sends the
+        updated game to every player.
+        Assumes the guess is a valid uppercase letter.
+
+        :param g: a single letter
+        :type g: str
+        """
+        if self.is_over():
+            return
+
+        msg_index = check_guess(g, self.proverb,
+                                self.matches, self.non_matches)
+        # recreate var incomplete with new data
+        self.incomplete = incomplete_proverb(
+            self.proverb, self.matches, self.alphabet)
+
+        for language, (strings, writers) in list(self.members.items()):
+            if msg_index is None:
+                message = f"{g}"
+            else:
+                message = f"{g}: {strings[msg_index]}"
+            # render once per language, same bytes for every player
+            data = self.render(strings, message).encode()
+            for writer in list(writers):
+                self.send(language, writer, data)
+
+    def render(self, strings, message):
+        """
+        Returns the screen sent to the players of a language.
+
+        :param strings: the strings of the language
+        :type strings: list
+        :param message: message to display under the proverb
+        :type message: str
+        :return: the game screen
+        :rtype: str
+        """
+        if complete_proverb(self.incomplete):
+            # win message
+            return f"{cls}\n\n{self.incomplete}\n\n" \
+                   f"{strings[12]}\n\n{strings[21]}? "
+        if len(self.non_matches) >= get_max_guess_number():
+            # lose message
+            return f"{cls}{draw_hangman(len(self.non_matches))}\n\n" \
+                   f"{self.proverb}\n\n{strings[13]}\n\n{strings[21]}? "
+        screen = game_screen(strings, self.non_matches,
+                             self.incomplete, message)
+        return f"{cls}{screen}\n{strings[8]}"
+
+    def send(self, language, writer, data):
+        """
+        Writes data to a player without waiting for it to be sent.
+        Drops the player if they fall too far behind.
+
+        :param language: the player's language
+        :type language: str
+        :param writer: the player's stream writer
+        :type writer: asyncio.StreamWriter
+        :param data: the encoded game screen
+        :type data: bytes
+        """
+        if writer.is_closing():
+            self.leave(language, writer)
+            return
+        writer.write(data)
+        if writer.transport.get_write_buffer_size() > MAX_BUFFER:
+            self.leave(language, writer)
+            writer.transport.abort()
+
+
+class Server:
+    """
+    Accepts players and keeps track of the open rooms.
+    """
+    def __init__(self):
+        self.lang_file = os.path.join("resources", "lang.csv")
+        self.languages = get_language_list(self.lang_file)
+        # language -> strings, read once per language
+        self.strings = {}
+        # room name -> Room
+        self.rooms = {}
+
+    def get_room_strings(self, language):
+        """
+        Returns the strings of a language, reading them on first use.
+
+        :param language: a language from lang.csv
+        :type language: str
+        :return: list of strings
+        :rtype: list
+        """
+        if language not in self.strings:
+            self.strings[language] = get_strings(self.lang_file, language)
+        return self.strings[language]
+
+    async def ask(self, reader, writer, prompt):
+        """
+        Sends a prompt to a player and returns their answer.
+
+        :param reader: the player's stream reader
+        :type reader: asyncio.StreamReader
+        :param writer: the player's stream writer
+        :type writer: asyncio.StreamWriter
+        :param prompt: the prompt
+        :type prompt: str
+        :return: the answer, None if the player disconnected
+        :rtype: str | None
+        """
+        writer.write(prompt.encode())
+        return await self.read_line(reader)
+
+    async def read_line(self, reader):
+        """
+        Reads a line sent by a player.
+
+        :param reader: the player's stream reader
+        :type reader: asyncio.StreamReader
+        :return: the line stripped, None if the player disconnected
+            or sent a line longer than the stream limit
+        :rtype: str | None
+        """
+        try:
+            line = await reader.readline()
+        except ValueError:
+            # the line is longer than the stream limit
+            return None
+        if not line:
+            return None
+        return line.decode(errors="replace").strip()
+
+    async def handle(self, reader, writer):
+        """
+        Serves a single player until they leave.
+
+        :param reader: the player's stream reader
+        :type reader: asyncio.StreamReader
+        :param writer: the player's stream writer
+        :type writer: asyncio.StreamWriter
+        """
+        room = None
+        language = None
+        try:
+            # Ask player to choose language
+            menu = "".join(f"    {i + 1}: {l}\n"
+                           for i, l in enumerate(self.languages))
+            selection = 0
+            while selection < 1 or selection > len(self.languages):
+                selection = await self.ask(reader, writer,
+                                           f"{cls}{menu}--> ")
+                if selection is None or selection in ("exit", "quit"):
+                    return
+                try:
+                    selection = int(selection)
+                except ValueError:
+                    selection = 0
+
+            language = self.languages[selection - 1]
+            strings = self.get_room_strings(language)
+
+            # Ask player to choose a room
+            name = ""
+            while not name:
+                name = await self.ask(reader, writer, "Room: ")
+                if name is None or name in ("exit", "quit"):
+                    return
+
+            # open a new room or join the game in the existing one
+            room = self.rooms.get(name)
+            if room is None or room.is_over():
+                room = Room(name, strings)
+                self.rooms[name] = room
+            room.join(language, strings, writer)
+
+            while True:
+                g = await self.read_line(reader)
+                if g is None:
+                    break
+                if g == "exit" or g == "quit":
+                    writer.write(strings[5].encode())
+                    break
+                if room.is_over():
+                    # start a new game in the room
+                    room.leave(language, writer)
+                    if room.is_empty() and self.rooms.get(name) is room:
+                        del self.rooms[name]
+                    room = self.rooms.get(name)
+                    if room is None or room.is_over():
+                        room = Room(name, strings)
+                        self.rooms[name] = room
+                    room.join(language, strings, writer)
+                elif letter_only(g, room.alphabet) is False:
+                    # print invalid input message
+                    writer.write(f"{strings[9]}\n{strings[8]}".encode())
+                else:
+                    room.guess(g.upper())
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if room is not None:
+                room.leave(language, writer)
+                if room.is_empty() and self.rooms.get(room.name) is room:
+                    del self.rooms[room.name]
+            writer.close()
+
+
+async def main(port):
+    server = Server()
+    srv = await asyncio.start_server(server.handle, port=port)
+    async with srv:
+        await srv.serve_forever()
+
+
+if __name__ == "__main__":
+    # Wrong argument message
+    message = "Argument unrecognized.\n" \
+              "Usage:\n" \
+              "     hangman-server.py\n" \
+              "     hangman-server.py PORT\n" \
+              "     hangman-server.py -h\n" \
+              "     hangman-server.py --help"
+
+    # Check arguments
+    port = PORT
+    if len(sys.argv) == 1:
+        pass
+    elif len(sys.argv) > 2:
+        print(message)
+        sys.exit(2)
+    elif sys.argv[1] == "-h" or sys.argv[1] == "--help":
+        print(__doc__)
+        sys.exit(2)
+    else:
+        try:
+            port = int(sys.argv[1])
+        except ValueError:
+            print(message)
+            sys.exit(2)
+
+    try:
+        asyncio.run(main(port))
+    except KeyboardInterrupt:
+        pass
+
+    sys.exit(0)
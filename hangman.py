@@ -10,7 +10,7 @@ Created:    2017-11-24
 IDE:        PyCharm Community Edition
 
 Synopsis:
-            hangman.py [ARGUMENT]
+            hangman.py [-r] [-t SECONDS] [-h]
 
 Description:
             A simple hangman game that runs in the command line.
@@ -20,8 +20,20 @@ Description:
             a penalty. The game ends when you guess all letters
             correctly or when the hangman is finished.
 
+            A won game is scored by the number of different letters
+            in the proverb, the incorrect guesses and the penalties.
+            The best score of every player is saved in the leaderboard.
+
             Optional arguments
 
+            -r, --raw
+                read single keypresses instead of lines,
+                press Esc to leave the game
+
+            -t SECONDS, --timer SECONDS
+                give SECONDS seconds for every guess, when the time's
+                up you get a penalty, implies --raw
+
             -h, --help
                 show this docstring and exit
 
@@ -49,11 +61,14 @@ Exit codes:
             2: incorrect argument passed in command line
 """
 
+import math
 import os
 import random
 import sys
+import time
 
 from lib import get_ui_strings
+from lib import leaderboard
 
 __author__ = "Korvin F. Ezüst"
 __copyright__ = "Copyright (c) 2017., Korvin F. Ezüst"
@@ -311,6 +326,140 @@ def already_guessed(guess, lst):
     return False
 
 
+def check_guess(guess, pvb, matches, non_matches):
+    """
+    Checks the player's guess and updates the lists of guesses.
+    A repeated incorrect guess appends a "+1" penalty to non_matches.
+    Assumes everything is uppercase.
+
+    :param guess: a single letter
+    :type guess: str
+    :param pvb: the proverb
+    :type pvb: str
+    :param matches: letters guessed and in the proverb
+    :type matches: list
+    :param non_matches: letters guessed and not in the proverb
+    :type non_matches: list
+    :return: index of the message to display in the string list or None
+    :rtype: int | None
+    """
+    if already_guessed(guess, matches):
+        # correct guess already given
+        return 10
+    elif already_guessed(guess, non_matches):
+        # incorrect guess already given, append "penalty"
+        non_matches.append("+1")
+        return 11
+    elif in_proverb(guess, pvb):
+        matches.append(guess)
+    else:
+        non_matches.append(guess)
+    return None
+
+
+def game_screen(strings, non_matches, incomplete, message=""):
+    """
+    Returns the text displayed during the game: the hangman,
+    the incorrect guesses, the incomplete proverb and a message.
+
+    :param strings: the strings of the selected language
+    :type strings: list
+    :param non_matches: letters guessed and not in the proverb
+    :type non_matches: list
+    :param incomplete: proverb with underscores replacing unknown letters
+    :type incomplete: str
+    :param message: message to display under the proverb
+    :type message: str
+    :return: the game screen
+    :rtype: str
+    """
+    inc_guesses = wrong_guesses_to_display(sorted(non_matches))
+    ret = draw_hangman(len(non_matches)) + "\n"
+    # list of incorrect guesses
+    ret += f"{strings[6]}".replace("VARIABLE", f"{inc_guesses}") + "\n"
+    ret += f"{strings[7]}".replace("VARIABLE", f"{incomplete}") + "\n"
+    ret += message
+    return ret
+
+
+def get_score(pvb, non_matches, abc):
+    """
+    Returns the score of a won game. Every different letter of the
+    proverb is worth 10 points, every incorrect guess costs 15 points
+    and every penalty costs 25 points. The score can't be negative.
+    Assumes everything is uppercase.
+
+    :param pvb: the proverb
+    :type pvb: str
+    :param non_matches: letters guessed and not in the proverb
+    :type non_matches: list
+    :param abc: the alphabet used in the proverbs
+    :type abc: str
+    :return: the score
+    :rtype: int
+    """
+    difficulty = len(set(c for c in pvb if c in abc))
+    penalties = non_matches.count("+1")
+    wrong_guesses = len(non_matches) - penalties
+    return max(0, 10 * difficulty - 15 * wrong_guesses - 25 * penalties)
+
+
+def get_key_guess(term, strings, non_matches, incomplete, message,
+                  abc, timer=None):
+    """
+    Gets the player's guess one keypress at a time. The screen
+    is redrawn after every keypress and every second while the
+    timer is running.
+
+    :param term: the terminal in cbreak mode
+    :type term: lib.raw_terminal.RawTerminal
+    :param strings: the strings of the selected language
+    :type strings: list
+    :param non_matches: letters guessed and not in the proverb
+    :type non_matches: list
+    :param incomplete: proverb with underscores replacing unknown letters
+    :type incomplete: str
+    :param message: message to display under the proverb
+    :type message: str
+    :param abc: the alphabet used in the proverbs
+    :type abc: str
+    :param timer: seconds to make a guess, None for no limit
+    :type timer: float | None
+    :return: uppercase letter, "exit" to leave or None if the time's up
+    :rtype: str | None
+    """
+    deadline = None
+    if timer is not None:
+        deadline = time.monotonic() + timer
+
+    while True:
+        screen = "\033[H\033[J"
+        screen += game_screen(strings, non_matches, incomplete, message)
+        timeout = None
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            screen += "\n" + f"{strings[28]}".replace(
+                "VARIABLE", f"{math.ceil(remaining)}")
+            # wake up when the displayed second changes
+            timeout = remaining - math.floor(remaining) or 1
+        screen += "\n" + f"{strings[8]}"
+        print(screen, end="", flush=True)
+
+        key = term.read_key(timeout)
+        if key is None:
+            # countdown tick
+            continue
+        if key in term.EXIT_KEYS:
+            return "exit"
+        if letter_only(key, abc):
+            return key.upper()
+        if key:
+            # invalid input message
+            message = f"{strings[9]}"
+
+
 def get_max_guess_number():
     """
     Returns the number of guesses the player has
@@ -325,21 +474,46 @@ if __name__ == '__main__':
     message = "Argument unrecognized.\n" \
               "Usage:\n" \
               "     game.py\n" \
+              "     game.py -r\n" \
+              "     game.py -t SECONDS\n" \
               "     game.py -h\n" \
               "     game.py --help"
 
     # Check arguments
-    if len(sys.argv) == 1:
-        pass
-    elif len(sys.argv) > 2:
-        print(message)
-        sys.exit(2)
-    elif sys.argv[1] == "-h" or sys.argv[1] == "--help":
-        print(__doc__)
-        sys.exit(2)
-    else:
-        print(message)
-        sys.exit(2)
+    raw_mode = False
+    timer = None
+    args = sys.argv[1:]
+    while args:
+        arg = args.pop(0)
+        if arg == "-h" or arg == "--help":
+            print(__doc__)
+            sys.exit(2)
+        elif arg == "-r" or arg == "--raw":
+            raw_mode = True
+        elif (arg == "-t" or arg == "--timer") and args:
+            try:
+                timer = float(args.pop(0))
+            except ValueError:
+                timer = 0
+            if not math.isfinite(timer) or timer <= 0:
+                print(message)
+                sys.exit(2)
+            raw_mode = True
+        else:
+            print(message)
+            sys.exit(2)
+
+    term = None
+    if raw_mode:
+        try:
+            from lib import raw_terminal
+            term = raw_terminal.RawTerminal()
+        except ImportError:
+            pass
+        # stdin has to be a terminal, not a pipe or a file
+        if term is None or not term.is_supported():
+            print("Raw mode is not supported on this system")
+            sys.exit(1)
 
     language_file = os.path.join("resources", "lang.csv")
     language_list = get_ui_strings.get_language_list(language_file)
@@ -381,8 +555,16 @@ if __name__ == '__main__':
 
     # Welcome message
     print(cls, end="")
-    print(string_list[4])
-    input()
+    if term is None:
+        print(string_list[4])
+        input()
+    else:
+        term.start()
+        print(string_list[29], end="", flush=True)
+        if term.read_key() in term.EXIT_KEYS:
+            term.stop()
+            print(string_list[5])
+            sys.exit(0)
 
     # Bye message
     bye = string_list[5]
@@ -400,58 +582,80 @@ if __name__ == '__main__':
     # Continue asking for input until the hangman
     # or the game is finished
     while len(non_matches) < get_max_guess_number():
-        print(cls, end="")
-
-        print(draw_hangman(len(non_matches)))
-
-        inc_guesses = wrong_guesses_to_display(sorted(non_matches))
-        # Print list of incorrect guesses
-        print(f"{string_list[6]}".replace("VARIABLE", f"{inc_guesses}"))
-        print(f"{string_list[7]}".replace("VARIABLE", f"{incomplete}"))
-        print(message)
-
-        # Get player input
-        g = None
-        while g is None:
-            # ask player for guess
-            g = input(f"{string_list[8]}")
-            if letter_only(g, alphabet) is False:
-                if g == "exit" or g == "quit":
-                    print(bye)
-                    sys.exit(0)
-                g = None
-                # print invalid input message
-                print(f"{string_list[9]}")
-            else:
-                g = g.upper()
+        if term is not None:
+            # Get player input one keypress at a time
+            g = get_key_guess(term, string_list, non_matches,
+                              incomplete, message, alphabet, timer)
+            if g == "exit":
+                term.stop()
+                print("\n" + bye)
+                sys.exit(0)
+            if g is None:
+                # time's up, append "penalty"
+                non_matches.append("+1")
+                message = f"{string_list[27]}"
+                continue
+        else:
+            print(cls, end="")
+
+            print(game_screen(string_list, non_matches, incomplete, message))
+
+            # Get player input
+            g = None
+            while g is None:
+                # ask player for guess
+                g = input(f"{string_list[8]}")
+                if letter_only(g, alphabet) is False:
+                    if g == "exit" or g == "quit":
+                        print(bye)
+                        sys.exit(0)
+                    g = None
+                    # print invalid input message
+                    print(f"{string_list[9]}")
+                else:
+                    g = g.upper()
 
         # Check guess
-        if already_guessed(g, matches):
-            # correct guess already given
-            message = f"{string_list[10]}"
-        elif already_guessed(g, non_matches):
-            # incorrect guess already given
-            message = f"{string_list[11]}"
-            # append "penalty" to non_matches
-            non_matches.append("+1")
-        elif in_proverb(g, proverb):
-            matches.append(g)
+        msg_index = check_guess(g, proverb, matches, non_matches)
+        if msg_index is None:
             message = ""
         else:
-            non_matches.append(g)
-            message = ""
+            message = f"{string_list[msg_index]}"
 
         # recreate var incomplete with new data
         incomplete = incomplete_proverb(proverb, matches, alphabet)
 
         if complete_proverb(incomplete):
+            if term is not None:
+                term.stop()
+                print(cls, end="")
             print("\n")
             print(incomplete, "\n")
             # win message
             print(f"{string_list[12]}")
-            print(bye)
+
+            score = get_score(proverb, non_matches, alphabet)
+            print(f"{string_list[23]}".replace("VARIABLE", f"{score}"))
+            name = input(f"{string_list[24]}").strip()
+            if name and name != "exit" and name != "quit":
+                board = leaderboard.Leaderboard(
+                    os.path.join("resources", "leaderboard.csv"))
+                rank = board.add(name, score)
+                print(f"{string_list[25]}".replace("VARIABLE", f"{rank}"))
+                print(f"\n{string_list[26]}")
+                for i, (n, s) in enumerate(board.top()):
+                    print(f"    {i + 1}: {n} ({s})")
+                print(bye, flush=True)
+                # merging the leaderboard's log can take a few seconds,
+                # do it after the results are on the screen
+                board.compact_if_needed()
+                board.close()
+            else:
+                print(bye)
             sys.exit(0)
 
+    if term is not None:
+        term.stop()
     print(cls, end="")
 
     print(draw_hangman(len(non_matches)), "\n")
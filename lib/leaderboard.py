@@ -0,0 +1,657 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Project:    Proverbial Hangman
+File:       leaderboard.py
+Author:     agent
+
+Created:    2026-10-19
+
+Description:
+            A persistent leaderboard keeping the best score of
+            every player.
+
+Notes:
+            The leaderboard is kept in three files next to each other:
+
+            leaderboard.rank, a snapshot of every player sorted by
+            rank, and leaderboard.names, the same records sorted by
+            name. Both have fixed width records, so a player's score
+            and rank are found with a binary search reading O(log n)
+            records, the files are never loaded as a whole.
+
+            leaderboard.csv, a short log with a name and a score in
+            every line, appended every time a player improves their
+            best score. The log is read into indexable skip lists when
+            the leaderboard is opened. compact_if_needed() merges it
+            into the snapshot once it's longer than LOG_SIZE lines,
+            the game calls it after the results are shown. Merging
+            reads the sorted snapshot once, nothing is sorted again.
+            The new snapshot is written to .tmp files first, so a
+            merge that's interrupted is finished or rolled back at
+            the next start.
+
+            The first CACHE_SIZE places are kept in a list that's
+            updated with every change instead of being rebuilt.
+"""
+
+import csv
+import heapq
+import itertools
+import math
+import os
+import random
+
+__author__ = "agent"
+__copyright__ = "Copyright (c) 2026., agent"
+__license__ = "Apache 2.0"
+__version__ = "1.0"
+__email__ = "agent@local"
+__status__ = "Development"
+
+# Number of top places kept up to date in memory
+CACHE_SIZE = 10
+# Number of log lines merged into the snapshot at once
+LOG_SIZE = 1000
+# Number of levels of the skip list, enough for 2 ** 32 entries
+MAX_LEVELS = 32
+# Longest name in bytes, longer names are shortened
+NAME_BYTES = 64
+# Snapshot record: 10 digit score, name padded with spaces, newline
+RECORD_SIZE = 10 + NAME_BYTES + 1
+
+
+def shorten_name(name):
+    """
+    Strips a name and shortens it to fit in a snapshot record.
+
+    :param name: a player's name
+    :type name: str
+    :return: the name stored in the leaderboard
+    :rtype: str
+    """
+    name = name.strip().encode()[:NAME_BYTES]
+    return name.decode(errors="ignore").strip()
+
+
+def rank_key(record):
+    """
+    Returns the key players are ranked by, the best score first
+    and players with the same score ordered by name.
+
+    :param record: (name, score)
+    :type record: tuple
+    :return: (-score, name)
+    :rtype: tuple
+    """
+    return -record[1], record[0]
+
+
+def name_key(record):
+    """
+    Returns the key of the names snapshot.
+
+    :param record: (name, score)
+    :type record: tuple
+    :return: name
+    :rtype: str
+    """
+    return record[0]
+
+
+class Node:
+    """
+    A node of the skip list. width[level] is the number of steps
+    to the next node on that level.
+    """
+    __slots__ = "value", "next", "width"
+
+    def __init__(self, value, levels):
+        self.value = value
+        self.next = [None] * levels
+        self.width = [1] * levels
+
+
+class SkipList:
+    """
+    Sorted list with O(log n) insert, remove, rank and index lookup.
+    """
+    def __init__(self):
+        self.head = Node(None, MAX_LEVELS)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i):
+        """
+        Returns the value at a given index.
+
+        :param i: index, 0 is the smallest value
+        :type i: int
+        :return: the value
+        """
+        if i < 0 or i >= self.size:
+            raise IndexError("skip list index out of range")
+        node = self.head
+        i += 1
+        for level in reversed(range(MAX_LEVELS)):
+            while node.next[level] is not None and node.width[level] <= i:
+                i -= node.width[level]
+                node = node.next[level]
+        return node.value
+
+    def __iter__(self):
+        return self.values()
+
+    def __contains__(self, value):
+        i = self.index(value)
+        return i < self.size and self[i] == value
+
+    def values(self, start=0):
+        """
+        Iterates over the values from a given index.
+
+        :param start: index of the first value
+        :type start: int
+        :return: generator of the values
+        """
+        if start >= self.size:
+            return
+        node = self.head
+        i = start + 1
+        for level in reversed(range(MAX_LEVELS)):
+            while node.next[level] is not None and node.width[level] <= i:
+                i -= node.width[level]
+                node = node.next[level]
+        while node is not None:
+            yield node.value
+            node = node.next[0]
+
+    def insert(self, value):
+        """
+        Inserts a value and returns its index.
+
+        :param value: the value to insert
+        :return: index of the inserted value
+        :rtype: int
+        """
+        # number of levels of the new node, level n has a 2 ** -n chance
+        levels = min(MAX_LEVELS, 1 - int(math.log(1 - random.random(), 2)))
+        chain = [None] * MAX_LEVELS
+        steps_at_level = [0] * MAX_LEVELS
+        node = self.head
+        for level in reversed(range(MAX_LEVELS)):
+            while node.next[level] is not None \
+                    and node.next[level].value <= value:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        new_node = Node(value, levels)
+        steps = 0
+        for level in range(levels):
+            prev_node = chain[level]
+            new_node.next[level] = prev_node.next[level]
+            prev_node.next[level] = new_node
+            new_node.width[level] = prev_node.width[level] - steps
+            prev_node.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(levels, MAX_LEVELS):
+            chain[level].width[level] += 1
+
+        self.size += 1
+        # every value passed on the way down comes before the new one
+        return sum(steps_at_level)
+
+    def remove(self, value):
+        """
+        Removes a value and returns its former index.
+        Raises ValueError if the value isn't in the list.
+
+        :param value: the value to remove
+        :return: index of the removed value
+        :rtype: int
+        """
+        chain = [None] * MAX_LEVELS
+        index = 0
+        node = self.head
+        for level in reversed(range(MAX_LEVELS)):
+            while node.next[level] is not None \
+                    and node.next[level].value < value:
+                index += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        found = chain[0].next[0]
+        if found is None or found.value != value:
+            raise ValueError(f"{value} not in skip list")
+
+        for level in range(len(found.next)):
+            prev_node = chain[level]
+            prev_node.width[level] += found.width[level] - 1
+            prev_node.next[level] = found.next[level]
+        for level in range(len(found.next), MAX_LEVELS):
+            chain[level].width[level] -= 1
+
+        self.size -= 1
+        return index
+
+    def index(self, value):
+        """
+        Returns the number of values smaller than the given value,
+        the index of the value if it's in the list.
+
+        :param value: the value to look up
+        :return: index of the value
+        :rtype: int
+        """
+        index = 0
+        node = self.head
+        for level in reversed(range(MAX_LEVELS)):
+            while node.next[level] is not None \
+                    and node.next[level].value < value:
+                index += node.width[level]
+                node = node.next[level]
+        return index
+
+
+class SortedFile:
+    """
+    Read-only file of fixed width (name, score) records sorted by key.
+    """
+    def __init__(self, filename, key):
+        self.key = key
+        self.file = None
+        self.size = 0
+        if filename is not None and os.path.isfile(filename):
+            self.file = open(filename, "rb")
+            self.size = os.path.getsize(filename) // RECORD_SIZE
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i):
+        """
+        Reads the record at a given index.
+
+        :param i: index of the record
+        :type i: int
+        :return: (name, score)
+        :rtype: tuple
+        """
+        if i < 0 or i >= self.size:
+            raise IndexError("sorted file index out of range")
+        self.file.seek(i * RECORD_SIZE)
+        return self.decode(self.file.read(RECORD_SIZE))
+
+    def index(self, key):
+        """
+        Returns the number of records with a smaller key, the index
+        of the record with the key if it's in the file.
+
+        :param key: the key to look up
+        :return: index of the key
+        :rtype: int
+        """
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            if self.key(self[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def values(self, start=0):
+        """
+        Reads the records from a given index in big chunks.
+
+        :param start: index of the first record
+        :type start: int
+        :return: generator of (name, score) tuples
+        """
+        position = start * RECORD_SIZE
+        while start < self.size:
+            # seek every time, the file may be read in between
+            self.file.seek(position)
+            chunk = self.file.read(RECORD_SIZE * 1024)
+            if not chunk:
+                break
+            position += len(chunk)
+            for i in range(0, len(chunk) - RECORD_SIZE + 1, RECORD_SIZE):
+                yield self.decode(chunk[i:i + RECORD_SIZE])
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    @staticmethod
+    def decode(data):
+        return data[10:-1].rstrip(b" ").decode(), int(data[:10])
+
+    @staticmethod
+    def write(filename, records):
+        """
+        Writes records to a file.
+
+        :param filename: the file to write
+        :type filename: str
+        :param records: (name, score) tuples, already sorted
+        """
+        with open(filename, "wb") as f:
+            for name, score in records:
+                name = name.encode().ljust(NAME_BYTES)
+                f.write(b"%010d%s\n" % (score, name))
+
+
+class Leaderboard:
+    """
+    The best score of every player, ranked from the highest score.
+    Players with the same score are ranked by name.
+    Without a file name the leaderboard is kept in memory only.
+    """
+    def __init__(self, filename=None, log_size=LOG_SIZE):
+        self.filename = filename
+        self.log_size = log_size
+        # number of lines in the log
+        self.log_length = 0
+        # name -> best score of the players in the log
+        self.scores = {}
+        # (-score, name) of the players in the log
+        self.ranking = SkipList()
+        # (-score, name) of snapshot records replaced by the log
+        self.stale = SkipList()
+        # [(name, score), ...] of the first CACHE_SIZE places
+        self.top_cache = []
+
+        self.rank_file = None
+        self.names_file = None
+        if filename is not None:
+            base = os.path.splitext(filename)[0]
+            self.rank_file = base + ".rank"
+            self.names_file = base + ".names"
+        if filename is not None:
+            self.recover()
+        self.open_snapshot()
+
+        if filename is not None and os.path.isfile(filename):
+            self.load()
+        self.top_cache = self.top_entries(CACHE_SIZE)
+
+    def __len__(self):
+        return len(self.snapshot) - len(self.stale) + len(self.ranking)
+
+    def open_snapshot(self):
+        """
+        Opens the snapshot files, they don't have to exist.
+        """
+        self.snapshot = SortedFile(self.rank_file, rank_key)
+        self.names = SortedFile(self.names_file, name_key)
+
+    def close(self):
+        """
+        Closes the snapshot files.
+        """
+        self.snapshot.close()
+        self.names.close()
+
+    def load(self):
+        """
+        Reads the scores in the log.
+        """
+        with open(self.filename, newline="") as f:
+            for row in csv.reader(f):
+                try:
+                    name, score = row[0], int(row[1])
+                except (IndexError, ValueError):
+                    continue
+                self.log_length += 1
+                old = self.get_score(name)
+                if old is None or old < score:
+                    if old is not None:
+                        self.remove(name, old)
+                    self.insert(name, score)
+
+    def compact_if_needed(self):
+        """
+        Merges the log into the snapshot if it's longer than log_size
+        lines. Takes O(n) time when it merges, seconds with millions
+        of players.
+
+        :return: True if the log was merged
+        :rtype: bool
+        """
+        if self.filename is None or self.log_length <= self.log_size:
+            return False
+        self.compact()
+        return True
+
+    def compact(self):
+        """
+        Merges the log into the snapshot and empties the log.
+        Reads and writes the whole snapshot, it takes O(n) time.
+
+        The new snapshot is written next to the old one first, then
+        the log is moved aside, which marks the switch to the new
+        snapshot. If the program is stopped before that, the new
+        files are deleted when the leaderboard is opened again,
+        if it's stopped after, the switch is finished.
+        """
+        stale = set(self.stale)
+        snapshot = (rank_key(r) for r in self.snapshot.values())
+        ranked = heapq.merge(
+            (k for k in snapshot if k not in stale), self.ranking)
+        SortedFile.write(self.rank_file + ".tmp",
+                         ((name, -score) for score, name in ranked))
+
+        names = heapq.merge(
+            (r for r in self.names.values() if r[0] not in self.scores),
+            sorted(self.scores.items()),
+            key=name_key)
+        SortedFile.write(self.names_file + ".tmp", names)
+
+        self.close()
+        # make sure there's a log to move aside
+        with open(self.filename, "a"):
+            pass
+        os.replace(self.filename, self.filename + ".old")
+        self.recover()
+
+        self.log_length = 0
+        self.scores = {}
+        self.ranking = SkipList()
+        self.stale = SkipList()
+        self.open_snapshot()
+
+    def recover(self):
+        """
+        Finishes a compaction stopped after the log was moved aside,
+        or rolls back one stopped before.
+        """
+        old_log = self.filename + ".old"
+        switching = os.path.isfile(old_log)
+        for filename in self.rank_file, self.names_file:
+            if os.path.isfile(filename + ".tmp"):
+                if switching:
+                    os.replace(filename + ".tmp", filename)
+                else:
+                    os.remove(filename + ".tmp")
+        if switching:
+            os.remove(old_log)
+
+    def index(self, key):
+        """
+        Returns the number of players ranked before a key.
+
+        :param key: (-score, name)
+        :type key: tuple
+        :return: index of the key
+        :rtype: int
+        """
+        return self.snapshot.index(key) - self.stale.index(key) \
+            + self.ranking.index(key)
+
+    def get_score(self, name):
+        """
+        Returns a player's best score.
+
+        :param name: the player's name
+        :type name: str
+        :return: the best score, None if the player isn't ranked
+        :rtype: int | None
+        """
+        if name in self.scores:
+            return self.scores[name]
+        i = self.names.index(name)
+        if i < len(self.names):
+            n, score = self.names[i]
+            if n == name:
+                return score
+        return None
+
+    def remove(self, name, score):
+        """
+        Removes a player's score from the ranking.
+
+        :param name: the player's name
+        :type name: str
+        :param score: the player's current score
+        :type score: int
+        :return: the player's former index
+        :rtype: int
+        """
+        key = (-score, name)
+        index = self.index(key)
+        if name in self.scores:
+            self.ranking.remove(key)
+            del self.scores[name]
+        else:
+            # the record stays in the snapshot until the next compaction
+            self.stale.insert(key)
+        return index
+
+    def insert(self, name, score):
+        """
+        Adds a player's score to the ranking.
+        Assumes the player isn't ranked.
+
+        :param name: the player's name
+        :type name: str
+        :param score: the player's score
+        :type score: int
+        :return: the player's index
+        :rtype: int
+        """
+        key = (-score, name)
+        index = self.index(key)
+        self.scores[name] = score
+        self.ranking.insert(key)
+        return index
+
+    def walk(self, after=None):
+        """
+        Iterates over the ranking after a given key.
+
+        :param after: (-score, name), None to start from the first place
+        :type after: tuple | None
+        :return: generator of (-score, name) tuples
+        """
+        snapshot_start = ranking_start = 0
+        if after is not None:
+            snapshot_start = self.snapshot.index(after)
+            if snapshot_start < len(self.snapshot) \
+                    and rank_key(self.snapshot[snapshot_start]) == after:
+                snapshot_start += 1
+            ranking_start = self.ranking.index(after)
+            if after in self.ranking:
+                ranking_start += 1
+
+        snapshot = (rank_key(r) for r in self.snapshot.values(snapshot_start))
+        return heapq.merge((k for k in snapshot if k not in self.stale),
+                           self.ranking.values(ranking_start))
+
+    def top_entries(self, k):
+        """
+        Walks the first k places of the ranking.
+
+        :param k: number of places
+        :type k: int
+        :return: (name, score) tuples, the best first
+        :rtype: list
+        """
+        return [(name, -score) for score, name
+                in itertools.islice(self.walk(), k)]
+
+    def add(self, name, score):
+        """
+        Records a score. It only counts if it's better than
+        the player's best score.
+        Takes O(log n) time, the log isn't merged into the snapshot
+        here, call compact_if_needed() when the results are shown.
+
+        :param name: the player's name, shortened to NAME_BYTES
+        :type name: str
+        :param score: the score of a game
+        :type score: int
+        :return: the player's rank, starting from 1
+        :rtype: int
+        """
+        name = shorten_name(name)
+        old = self.get_score(name)
+        if old is not None and old >= score:
+            return self.rank(name)
+
+        if old is not None:
+            index = self.remove(name, old)
+            if index < len(self.top_cache):
+                del self.top_cache[index]
+                # move the next player up into the cache
+                after = None
+                if self.top_cache:
+                    after = rank_key(self.top_cache[-1])
+                following = next(self.walk(after), None)
+                if following is not None:
+                    self.top_cache.append((following[1], -following[0]))
+
+        index = self.insert(name, score)
+        if index < CACHE_SIZE:
+            self.top_cache.insert(index, (name, score))
+            del self.top_cache[CACHE_SIZE:]
+
+        if self.filename is not None:
+            with open(self.filename, "a", newline="") as f:
+                csv.writer(f).writerow([name, score])
+            self.log_length += 1
+
+        return index + 1
+
+    def rank(self, name):
+        """
+        Returns a player's rank.
+
+        :param name: the player's name
+        :type name: str
+        :return: the player's rank starting from 1, None if not ranked
+        :rtype: int | None
+        """
+        name = shorten_name(name)
+        score = self.get_score(name)
+        if score is None:
+            return None
+        return self.index((-score, name)) + 1
+
+    def top(self, k=CACHE_SIZE):
+        """
+        Returns the best k players.
+
+        :param k: number of players
+        :type k: int
+        :return: (name, score) tuples, the best first
+        :rtype: list
+        """
+        if k <= CACHE_SIZE:
+            return self.top_cache[:k]
+        return self.top_entries(k)
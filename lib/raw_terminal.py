@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Project:    Proverbial Hangman
+File:       raw_terminal.py
+Author:     agent
+
+Created:    2026-10-19
+
+Description:
+            Reads single keypresses from the terminal without
+            waiting for Enter.
+
+Notes:
+            Works only on Unix-like systems, it needs the termios
+            and tty modules.
+
+            The terminal is switched to cbreak mode, keys are read
+            one by one and not echoed, but Ctrl+C still works.
+            The original settings are restored when the program exits.
+
+            Esc leaves the game, but it also starts the sequences sent
+            by keys like the arrows. After Esc, the rest of a sequence
+            is waited for ESCAPE_DELAY seconds, a sequence split by a
+            longer delay is read as Esc and the keys after it.
+"""
+
+import atexit
+import codecs
+import os
+import selectors
+import sys
+import termios
+import tty
+
+__author__ = "agent"
+__copyright__ = "Copyright (c) 2026., agent"
+__license__ = "Apache 2.0"
+__version__ = "1.0"
+__email__ = "agent@local"
+__status__ = "Development"
+
+# Seconds to wait for the rest of an escape sequence after Esc
+ESCAPE_DELAY = 0.05
+
+
+class RawTerminal:
+    """
+    Single keypress input with an optional timeout.
+    """
+    # Keys that leave the game: Escape and Ctrl+D
+    EXIT_KEYS = ("\x1b", "\x04")
+
+    def __init__(self, stream=sys.stdin):
+        self.fd = stream.fileno()
+        self.old_settings = None
+        self.selector = selectors.DefaultSelector()
+        # decodes multi-byte characters like the Hungarian letters
+        self.decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        # keys read but not returned yet
+        self.keys = []
+
+    def is_supported(self):
+        """
+        Checks if the input is a terminal that can be switched
+        to cbreak mode.
+
+        :return: True | False
+        :rtype: bool
+        """
+        if not os.isatty(self.fd):
+            return False
+        try:
+            termios.tcgetattr(self.fd)
+        except termios.error:
+            return False
+        return True
+
+    def start(self):
+        """
+        Switches the terminal to cbreak mode.
+        """
+        if self.old_settings is None:
+            self.old_settings = termios.tcgetattr(self.fd)
+            tty.setcbreak(self.fd)
+            self.selector.register(self.fd, selectors.EVENT_READ)
+            atexit.register(self.stop)
+
+    def stop(self):
+        """
+        Restores the original terminal settings.
+        """
+        if self.old_settings is not None:
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old_settings)
+            self.selector.unregister(self.fd)
+            self.old_settings = None
+
+    def read_key(self, timeout=None):
+        """
+        Waits for a keypress at most timeout seconds.
+        Escape sequences, like the ones sent by the arrow keys,
+        are returned as an empty string.
+
+        :param timeout: seconds to wait, None to wait forever
+        :type timeout: float | None
+        :return: the key pressed, None if the time ran out
+        :rtype: str | None
+        """
+        if not self.keys:
+            if not self.read_input(timeout):
+                return None
+            if not self.keys:
+                # incomplete multi-byte character
+                return ""
+
+        key = self.keys.pop(0)
+        # CSI (Esc [) and SS3 (Esc O) sequences, anything else
+        # after Esc is a separate keypress
+        if key == "\x1b" and self.next_char() in ("[", "O"):
+            if self.keys.pop(0) == "[":
+                # parameter and intermediate bytes
+                while self.next_char() is not None \
+                        and " " <= self.keys[0] <= "?":
+                    self.keys.pop(0)
+            if self.next_char() is not None:
+                # final byte
+                self.keys.pop(0)
+            return ""
+        return key
+
+    def read_input(self, timeout):
+        """
+        Reads the input available within timeout seconds into keys.
+        The end of input is read as Ctrl+D.
+
+        :param timeout: seconds to wait, None to wait forever
+        :type timeout: float | None
+        :return: False if the time ran out
+        :rtype: bool
+        """
+        if not self.selector.select(timeout):
+            return False
+        data = os.read(self.fd, 32)
+        if not data:
+            # end of input
+            self.keys.append(self.EXIT_KEYS[1])
+        self.keys.extend(self.decoder.decode(data))
+        return True
+
+    def next_char(self):
+        """
+        Returns the next character of an escape sequence without
+        removing it. Waits ESCAPE_DELAY seconds for it, the rest of
+        a sequence may come in a separate read, e.g. over SSH.
+
+        :return: the next character, None if there isn't one
+        :rtype: str | None
+        """
+        if not self.keys:
+            self.read_input(ESCAPE_DELAY)
+        if self.keys:
+            return self.keys[0]
+        return None
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Project:    Proverbial Hangman
+File:       test_hangman.py
+Author:     agent
+
+Created:    2026-10-19
+
+Description:
+            Tests of the game logic shared by the command line game,
+            the GUI and the server.
+            Run from the project folder with python -m unittest
+"""
+
+import os
+import sys
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from hangman import *
+from lib import get_ui_strings
+
+__author__ = "agent"
+__copyright__ = "Copyright (c) 2026., agent"
+__license__ = "Apache 2.0"
+__version__ = "1.0"
+__email__ = "agent@local"
+__status__ = "Development"
+
+
+class TestCheckGuess(unittest.TestCase):
+    def setUp(self):
+        self.proverb = "NO PAIN NO GAIN"
+        self.matches = []
+        self.non_matches = []
+
+    def guess(self, g):
+        return check_guess(g, self.proverb, self.matches, self.non_matches)
+
+    def test_correct_guess(self):
+        self.assertIsNone(self.guess("N"))
+        self.assertEqual(self.matches, ["N"])
+        self.assertEqual(self.non_matches, [])
+
+    def test_incorrect_guess(self):
+        self.assertIsNone(self.guess("Z"))
+        self.assertEqual(self.matches, [])
+        self.assertEqual(self.non_matches, ["Z"])
+
+    def test_correct_guess_repeated(self):
+        self.guess("N")
+        self.assertEqual(self.guess("N"), 10)
+        self.assertEqual(self.matches, ["N"])
+        self.assertEqual(self.non_matches, [])
+
+    def test_incorrect_guess_repeated(self):
+        self.guess("Z")
+        self.assertEqual(self.guess("Z"), 11)
+        self.assertEqual(self.guess("Z"), 11)
+        self.assertEqual(self.matches, [])
+        self.assertEqual(self.non_matches, ["Z", "+1", "+1"])
+
+
+class TestGetScore(unittest.TestCase):
+    def setUp(self):
+        self.alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+    def test_letter_count(self):
+        # N, O, P, A, I, G: repeated letters and spaces don't count
+        self.assertEqual(get_score("NO PAIN NO GAIN", [], self.alphabet), 60)
+        # characters not in the alphabet don't count
+        self.assertEqual(get_score("A, B!", [], self.alphabet), 20)
+
+    def test_wrong_guesses(self):
+        self.assertEqual(
+            get_score("NO PAIN NO GAIN", ["Z", "X"], self.alphabet), 30)
+
+    def test_penalties(self):
+        self.assertEqual(
+            get_score("NO PAIN NO GAIN", ["Z", "+1"], self.alphabet), 20)
+        self.assertEqual(
+            get_score("NO PAIN NO GAIN", ["+1", "+1"], self.alphabet), 10)
+
+    def test_not_negative(self):
+        self.assertEqual(
+            get_score("AB", ["Z", "X", "+1", "Y"], self.alphabet), 0)
+
+
+class TestGameScreen(unittest.TestCase):
+    def test_game_screen(self):
+        lang_file = os.path.join(ROOT, "resources", "lang.csv")
+        strings = get_ui_strings.get_strings(lang_file, "English")
+        non_matches = ["Z", "+1", "X"]
+        screen = game_screen(strings, non_matches, "N_ ____", "message")
+
+        self.assertTrue(screen.startswith(draw_hangman(3) + "\n"))
+        self.assertIn(strings[6].replace("VARIABLE", "X, Z"), screen)
+        self.assertIn(strings[7].replace("VARIABLE", "N_ ____"), screen)
+        self.assertTrue(screen.endswith("\nmessage"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Project:    Proverbial Hangman
+File:       test_leaderboard.py
+Author:     agent
+
+Created:    2026-10-19
+
+Description:
+            Tests of the leaderboard against a sorted list.
+            Run from the project folder with python -m unittest
+"""
+
+import bisect
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from lib.leaderboard import CACHE_SIZE, Leaderboard, SkipList, SortedFile
+
+__author__ = "agent"
+__copyright__ = "Copyright (c) 2026., agent"
+__license__ = "Apache 2.0"
+__version__ = "1.0"
+__email__ = "agent@local"
+__status__ = "Development"
+
+
+def expected_ranking(best):
+    """
+    Returns the players ranked by a sorted list.
+
+    :param best: name -> best score
+    :type best: dict
+    :return: (name, score) tuples, the best first
+    :rtype: list
+    """
+    return [(name, -score) for score, name
+            in sorted((-score, name) for name, score in best.items())]
+
+
+class TestSkipList(unittest.TestCase):
+    def test_insert_remove_index(self):
+        random.seed(1)
+        skip_list = SkipList()
+        reference = []
+        for _ in range(3000):
+            if reference and random.random() < 0.3:
+                value = random.choice(reference)
+                i = bisect.bisect_left(reference, value)
+                self.assertEqual(skip_list.remove(value), i)
+                reference.pop(i)
+            else:
+                value = random.randint(0, 500)
+                i = bisect.bisect_right(reference, value)
+                self.assertEqual(skip_list.insert(value), i)
+                reference.insert(i, value)
+
+            value = random.randint(0, 500)
+            self.assertEqual(skip_list.index(value),
+                             bisect.bisect_left(reference, value))
+            self.assertEqual(len(skip_list), len(reference))
+
+        self.assertEqual(list(skip_list), reference)
+        for i in range(0, len(reference), 13):
+            self.assertEqual(skip_list[i], reference[i])
+            self.assertEqual(list(skip_list.values(i)), reference[i:])
+
+    def test_remove_missing(self):
+        skip_list = SkipList()
+        skip_list.insert(1)
+        with self.assertRaises(ValueError):
+            skip_list.remove(2)
+
+
+class TestLeaderboard(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.filename = os.path.join(self.folder, "leaderboard.csv")
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def check(self, board, best):
+        ranking = expected_ranking(best)
+        self.assertEqual(len(board), len(ranking))
+        self.assertEqual(board.top(), ranking[:CACHE_SIZE])
+        self.assertEqual(board.top(3 * CACHE_SIZE),
+                         ranking[:3 * CACHE_SIZE])
+        for i, (name, score) in enumerate(ranking):
+            self.assertEqual(board.rank(name), i + 1)
+            self.assertEqual(board.get_score(name), score)
+
+    def play(self, board, best, games, players):
+        for _ in range(games):
+            name = f"player{random.randint(0, players)}"
+            score = random.randint(0, 300)
+            rank = board.add(name, score)
+            board.compact_if_needed()
+            best[name] = max(best.get(name, score), score)
+            ranking = expected_ranking(best)
+            self.assertEqual(rank, ranking.index((name, best[name])) + 1)
+            self.assertEqual(board.top(), ranking[:CACHE_SIZE])
+
+    def test_memory(self):
+        random.seed(2)
+        board = Leaderboard()
+        best = {}
+        self.play(board, best, 2000, 300)
+        self.check(board, best)
+
+    def test_improve_inside_top(self):
+        board = Leaderboard()
+        best = {}
+        for i in range(3 * CACHE_SIZE):
+            board.add(f"player{i}", 10 * i)
+            best[f"player{i}"] = 10 * i
+
+        # players in the cached top places replace their own scores,
+        # moving up, staying in place and not improving
+        for name, score in (("player29", 1000), ("player25", 255),
+                            ("player22", 500), ("player20", 1),
+                            ("player21", 1001), ("player0", 600)):
+            board.add(name, score)
+            best[name] = max(best[name], score)
+            self.assertEqual(board.top(), expected_ranking(best)[:CACHE_SIZE])
+        self.check(board, best)
+
+    def test_file(self):
+        random.seed(3)
+        board = Leaderboard(self.filename, log_size=50)
+        best = {}
+        self.play(board, best, 1000, 200)
+        self.check(board, best)
+        self.assertLessEqual(board.log_length, 50)
+
+        # players replacing scores stored in the snapshot
+        board.close()
+        board = Leaderboard(self.filename, log_size=50)
+        self.check(board, best)
+        self.play(board, best, 30, 200)
+        self.check(board, best)
+        board.close()
+
+        board = Leaderboard(self.filename, log_size=50)
+        self.check(board, best)
+        board.compact()
+        self.assertEqual(board.log_length, 0)
+        self.assertFalse(os.path.isfile(self.filename))
+        self.check(board, best)
+        board.close()
+
+    def test_interrupted_compaction(self):
+        write = SortedFile.write
+        replace = os.replace
+        remove = os.remove
+        step = 0
+        while True:
+            # a new leaderboard with scores in the snapshot and the log,
+            # some of the log replacing scores in the snapshot
+            random.seed(4)
+            shutil.rmtree(self.folder)
+            os.mkdir(self.folder)
+            board = Leaderboard(self.filename, log_size=10000)
+            best = {}
+            self.play(board, best, 100, 40)
+            board.compact()
+            self.play(board, best, 50, 60)
+
+            # stop the compaction before the file operation number step
+            step += 1
+            calls = []
+
+            def interrupt(function):
+                def wrapper(*args):
+                    calls.append(function)
+                    if len(calls) == step:
+                        raise KeyboardInterrupt
+                    return function(*args)
+                return wrapper
+
+            with mock.patch.object(SortedFile, "write",
+                                   staticmethod(interrupt(write))), \
+                    mock.patch("os.replace", interrupt(replace)), \
+                    mock.patch("os.remove", interrupt(remove)):
+                try:
+                    board.compact()
+                    interrupted = False
+                except KeyboardInterrupt:
+                    interrupted = True
+            board.close()
+
+            board = Leaderboard(self.filename, log_size=10000)
+            self.check(board, best)
+            self.play(board, best, 20, 60)
+            board.compact()
+            self.check(board, best)
+            board.close()
+            if not interrupted:
+                break
+        # two writes, moving the log aside, two replaces and a remove
+        self.assertEqual(step, 7)
+
+    def test_compact_if_needed(self):
+        board = Leaderboard(self.filename, log_size=3)
+        for i in range(4):
+            board.add(f"p{i}", i)
+        # adding never merges the log
+        self.assertEqual(board.log_length, 4)
+        self.assertEqual(len(board.snapshot), 0)
+
+        self.assertTrue(board.compact_if_needed())
+        self.assertEqual(board.log_length, 0)
+        self.assertEqual(len(board.snapshot), 4)
+        self.assertFalse(board.compact_if_needed())
+        self.check(board, {f"p{i}": i for i in range(4)})
+        board.close()
+
+    def test_snapshot_without_log(self):
+        board = Leaderboard(self.filename, log_size=1)
+        best = {"p1": 10, "p2": 20, "p3": 30}
+        for name, score in best.items():
+            board.add(name, score)
+        board.compact()
+        board.close()
+        if os.path.isfile(self.filename):
+            os.remove(self.filename)
+
+        board = Leaderboard(self.filename, log_size=1)
+        self.check(board, best)
+        board.add("p9", 5)
+        best["p9"] = 5
+        self.check(board, best)
+        board.close()
+
+    def test_long_name(self):
+        board = Leaderboard(self.filename, log_size=1)
+        name = "á" * 100
+        board.add(name, 10)
+        board.add("b", 5)
+        board.close()
+
+        board = Leaderboard(self.filename, log_size=1)
+        self.assertEqual(board.rank(name), 1)
+        self.assertEqual(board.top(), [("á" * 32, 10), ("b", 5)])
+        board.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
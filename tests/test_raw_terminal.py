@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Project:    Proverbial Hangman
+File:       test_raw_terminal.py
+Author:     agent
+
+Created:    2026-10-19
+
+Description:
+            Tests of the single keypress input, reading keys from
+            a pseudo terminal.
+            Run from the project folder with python -m unittest
+"""
+
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from hangman import *
+from lib import get_ui_strings
+
+try:
+    import pty
+    from lib import raw_terminal
+except ImportError:
+    raw_terminal = None
+
+__author__ = "agent"
+__copyright__ = "Copyright (c) 2026., agent"
+__license__ = "Apache 2.0"
+__version__ = "1.0"
+__email__ = "agent@local"
+__status__ = "Development"
+
+
+@unittest.skipIf(raw_terminal is None, "needs termios and pty")
+class TestReadKey(unittest.TestCase):
+    def setUp(self):
+        self.master, slave = pty.openpty()
+        self.slave = os.fdopen(slave)
+        self.term = raw_terminal.RawTerminal(self.slave)
+        self.term.start()
+
+    def tearDown(self):
+        self.term.stop()
+        self.slave.close()
+        os.close(self.master)
+
+    def send(self, data):
+        os.write(self.master, data)
+        # let the pseudo terminal pass the data on
+        time.sleep(0.05)
+
+    def read_keys(self):
+        keys = []
+        key = self.term.read_key(0.1)
+        while key is not None:
+            keys.append(key)
+            key = self.term.read_key(0.1)
+        return keys
+
+    def test_letters(self):
+        self.send(b"ab")
+        self.assertEqual(self.read_keys(), ["a", "b"])
+
+    def test_escape_sequences_dropped(self):
+        # up arrow, F1, Ctrl+right arrow
+        self.send(b"\x1b[Aa\x1bOPb\x1b[1;5Cc")
+        self.assertEqual([k for k in self.read_keys() if k],
+                         ["a", "b", "c"])
+
+    def test_escape_followed_by_letter(self):
+        self.send(b"\x1bq")
+        self.assertEqual(self.read_keys(), ["\x1b", "q"])
+
+    def test_escape_alone(self):
+        self.send(b"\x1b")
+        self.assertEqual(self.read_keys(), ["\x1b"])
+
+    def test_escape_sequence_split(self):
+        # Esc in one read, the rest of the up arrow in the next one
+        self.send(b"\x1b")
+        rest = threading.Timer(raw_terminal.ESCAPE_DELAY / 3,
+                               os.write, (self.master, b"[A"))
+        rest.start()
+        self.assertEqual(self.term.read_key(0.1), "")
+        rest.join()
+        self.assertEqual(self.read_keys(), [])
+
+    def test_escape_sequence_split_too_long(self):
+        # known limitation, a longer delay reads as Esc and the keys
+        self.send(b"\x1b")
+        self.assertEqual(self.term.read_key(0.1), "\x1b")
+        self.send(b"[A")
+        self.assertEqual(self.read_keys(), ["[", "A"])
+
+    def test_split_multi_byte_letter(self):
+        data = "é".encode()
+        self.send(data[:1])
+        self.assertEqual(self.term.read_key(0.1), "")
+        self.send(data[1:])
+        self.assertEqual(self.term.read_key(0.1), "é")
+
+    def test_timeout(self):
+        start = time.monotonic()
+        self.assertIsNone(self.term.read_key(0.1))
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+
+@unittest.skipIf(raw_terminal is None, "needs termios and pty")
+class TestEndOfInput(unittest.TestCase):
+    def test_end_of_input(self):
+        read, write = os.pipe()
+        os.close(write)
+        with os.fdopen(read) as stream:
+            term = raw_terminal.RawTerminal(stream)
+            # a pipe can't be switched to cbreak mode, only select on it
+            self.assertFalse(term.is_supported())
+            term.selector.register(term.fd,
+                                   raw_terminal.selectors.EVENT_READ)
+            self.assertEqual(term.read_key(0.1), "\x04")
+            self.assertIn("\x04", term.EXIT_KEYS)
+
+
+class Terminal:
+    """
+    Returns keys from a list, None when the time runs out.
+    """
+    EXIT_KEYS = ("\x1b", "\x04")
+
+    def __init__(self, keys):
+        self.keys = list(keys)
+        self.timeouts = []
+
+    def read_key(self, timeout=None):
+        self.timeouts.append(timeout)
+        if self.keys:
+            return self.keys.pop(0)
+        time.sleep(timeout)
+        return None
+
+
+class TestGetKeyGuess(unittest.TestCase):
+    def setUp(self):
+        lang_file = os.path.join(ROOT, "resources", "lang.csv")
+        self.strings = get_ui_strings.get_strings(lang_file, "English")
+        self.output = io.StringIO()
+
+    def guess(self, term, timer=None):
+        with contextlib.redirect_stdout(self.output):
+            return get_key_guess(term, self.strings, [], "__ ____",
+                                 "", "ABCDEFGHIJKLMNOPQRSTUVWXYZ", timer)
+
+    def test_valid_key(self):
+        self.assertEqual(self.guess(Terminal(["a"])), "A")
+
+    def test_invalid_key(self):
+        term = Terminal(["1", "", "b"])
+        self.assertEqual(self.guess(term), "B")
+        # the screen is redrawn after every key
+        self.assertEqual(self.output.getvalue().count(self.strings[8]), 3)
+        self.assertIn(self.strings[9], self.output.getvalue())
+
+    def test_exit_keys(self):
+        self.assertEqual(self.guess(Terminal(["\x1b"])), "exit")
+        self.assertEqual(self.guess(Terminal(["\x04"])), "exit")
+
+    def test_countdown(self):
+        term = Terminal([])
+        self.assertIsNone(self.guess(term, timer=0.2))
+        # waits a fraction of a second at most, then redraws
+        self.assertTrue(all(0 < t <= 1 for t in term.timeouts))
+        self.assertIn(self.strings[28].replace("VARIABLE", "1"),
+                      self.output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
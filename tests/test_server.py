@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Project:    Proverbial Hangman
+File:       test_server.py
+Author:     agent
+
+Created:    2026-10-19
+
+Description:
+            Tests of the rooms of the multiplayer server.
+            Run from the project folder with python -m unittest
+"""
+
+import asyncio
+import importlib.util
+import os
+import sys
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from lib import get_ui_strings
+
+# the file name of the server isn't a valid module name
+spec = importlib.util.spec_from_file_location(
+    "hangman_server", os.path.join(ROOT, "hangman-server.py"))
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+__author__ = "agent"
+__copyright__ = "Copyright (c) 2026., agent"
+__license__ = "Apache 2.0"
+__version__ = "1.0"
+__email__ = "agent@local"
+__status__ = "Development"
+
+
+class Transport:
+    def __init__(self, buffered):
+        self.buffered = buffered
+        self.aborted = False
+
+    def get_write_buffer_size(self):
+        return self.buffered
+
+    def abort(self):
+        self.aborted = True
+
+
+class Writer:
+    """
+    Records what the room writes to a player.
+    """
+    def __init__(self, buffered=0):
+        self.transport = Transport(buffered)
+        self.data = []
+
+    def is_closing(self):
+        return self.transport.aborted
+
+    def write(self, data):
+        self.data.append(data)
+
+
+class TestRoom(unittest.TestCase):
+    def setUp(self):
+        # the room reads the proverbs from the resources folder
+        self.cwd = os.getcwd()
+        os.chdir(ROOT)
+        lang_file = os.path.join("resources", "lang.csv")
+        self.english = get_ui_strings.get_strings(lang_file, "English")
+        self.hungarian = get_ui_strings.get_strings(lang_file, "magyar")
+
+        self.room = server.Room("room", self.english)
+        self.room.proverb = "NO PAIN NO GAIN"
+        self.room.alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        self.room.incomplete = "__ ____ __ ____"
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def join(self, language, strings, count, buffered=0):
+        writers = [Writer(buffered) for _ in range(count)]
+        for writer in writers:
+            self.room.join(language, strings, writer)
+            writer.data.clear()
+        return writers
+
+    def test_render_once_per_language(self):
+        english = self.join("English", self.english, 5)
+        hungarian = self.join("magyar", self.hungarian, 3)
+
+        rendered = []
+        render = self.room.render
+
+        def counting_render(strings, message):
+            rendered.append(strings)
+            return render(strings, message)
+
+        self.room.render = counting_render
+        self.room.guess("N")
+
+        self.assertEqual(len(rendered), 2)
+        for writers in english, hungarian:
+            self.assertTrue(all(len(w.data) == 1 for w in writers))
+            # every member of a language gets the same bytes object
+            self.assertTrue(all(w.data[0] is writers[0].data[0]
+                                for w in writers))
+        self.assertNotEqual(english[0].data[0], hungarian[0].data[0])
+        self.assertIn(b"N_ ___N N_ ___N", english[0].data[0])
+
+    def test_slow_member_dropped(self):
+        members = self.join("English", self.english, 3)
+        slow = Writer(server.MAX_BUFFER + 1)
+        self.room.join("English", self.english, slow)
+
+        self.assertTrue(slow.transport.aborted)
+        self.assertNotIn(slow, self.room.members["English"][1])
+
+        self.room.guess("A")
+        self.assertEqual(len(slow.data), 1)
+        for writer in members:
+            self.assertEqual(len(writer.data), 1)
+            self.assertFalse(writer.transport.aborted)
+        self.assertEqual(self.room.members["English"][1], set(members))
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(ROOT)
+        self.errors = []
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: self.errors.append(context))
+        self.server = server.Server()
+        self.srv = await asyncio.start_server(
+            self.server.handle, "127.0.0.1", 0)
+        self.port = self.srv.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.srv.close()
+        await self.srv.wait_closed()
+        os.chdir(self.cwd)
+
+    async def connect(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1",
+                                                       self.port)
+        writer.write(b"1\nroom\n")
+        await writer.drain()
+        await reader.readuntil(b"Guess: ")
+        return reader, writer
+
+    async def test_overlong_line_drops_only_that_client(self):
+        reader, writer = await self.connect()
+        long_reader, long_writer = await self.connect()
+
+        long_writer.write(b"a" * 100000 + b"\n")
+        try:
+            await long_writer.drain()
+            self.assertEqual(
+                await asyncio.wait_for(long_reader.read(), 5), b"")
+        except ConnectionError:
+            pass
+
+        room = self.server.rooms["room"]
+        self.assertEqual(len(room.members["English"][1]), 1)
+
+        # the other player is still in the game
+        writer.write(b"e\n")
+        await writer.drain()
+        data = await asyncio.wait_for(reader.readuntil(b"Guess: "), 5)
+        self.assertIn(b"Incorrect guesses", data)
+        self.assertEqual(self.errors, [])
+
+        writer.close()
+        long_writer.close()
+
+
+if __name__ == "__main__":
+    unittest.main()